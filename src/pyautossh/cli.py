@@ -1,9 +1,16 @@
-import argparse
+from __future__ import annotations
+
+import functools
 import logging
+import sys
+from typing import TYPE_CHECKING
 
 from pyautossh.exceptions import SSHClientNotFound, SSHConnectionError
 from pyautossh.pyautossh import connect_ssh
 
+if TYPE_CHECKING:
+    import argparse
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,20 +32,41 @@ def main(argv: list[str] | None = None) -> int:
         Exit code: 0 for success, any non-zero value indicates an error
     """
 
-    parser = create_parser()
-    args, ssh_args = parser.parse_known_args(argv)
-    setup_logging(verbose=args.verbose)
-
-    if not ssh_args:
-        parser.print_help()
-        return 255
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args: argparse.Namespace | None = None
+    if _needs_argument_parser(argv):
+        parser = create_parser()
+        args, ssh_args = parser.parse_known_args(argv)
+        setup_logging(verbose=args.verbose)
+
+        if not ssh_args:
+            parser.print_help()
+            return 255
+    else:
+        # Fast path: no pyautossh options or help requested, so all settings
+        # are at their defaults and building the argument parser can be
+        # skipped entirely.
+        ssh_args = list(argv)
+        setup_logging()
 
     try:
-        connect_ssh(
-            ssh_args,
-            max_connection_attempts=args.max_connection_attempts,
-            reconnect_delay=args.reconnect_delay,
-        )
+        if args is None:
+            connect_ssh(ssh_args)
+        else:
+            connect_ssh(
+                ssh_args,
+                max_connection_attempts=args.max_connection_attempts,
+                reconnect_delay=args.reconnect_delay,
+                reconnect_backoff=args.reconnect_backoff,
+                max_reconnect_delay=args.max_reconnect_delay,
+                attempt_reset_seconds=args.attempt_reset_seconds,
+                keepalive_interval=args.keepalive_interval,
+                keepalive_count=args.keepalive_count,
+                add_keepalive=not args.no_keepalive,
+                exec_on_success=args.exec_on_success,
+            )
     except (SSHClientNotFound, SSHConnectionError) as exce:
         logger.error(str(exce))
         return 255
@@ -51,15 +79,36 @@ def main(argv: list[str] | None = None) -> int:
     return 0
 
 
+def _needs_argument_parser(argv: list[str]) -> bool:
+    """
+    Determine whether the command line requires the argument parser.
+
+    The parser is only needed when pyautossh options or help are requested,
+    or when there are no arguments at all (to print usage).
+    """
+
+    if not argv:
+        return True
+    return any(arg in ("-h", "--help") or arg.startswith("--autossh-") for arg in argv)
+
+
+@functools.lru_cache(maxsize=1)
 def create_parser() -> argparse.ArgumentParser:
     """
     Create the argument parser for pyautossh.
 
+    The parser is built once on first use and cached; all options have static
+    defaults, so the same instance can be reused for every parse.
+
     Returns
     -------
     argparse.ArgumentParser
         The configured argument parser
     """
+    # Imported lazily: argparse is comparatively expensive to import and the
+    # parser is not needed before this point.
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Automatically reconnect SSH sessions when they disconnect"
     )
@@ -75,7 +124,61 @@ def create_parser() -> argparse.ArgumentParser:
         dest="reconnect_delay",
         type=float,
         default=1.0,
-        help="Delay in seconds between reconnection attempts (default: 1.0)",
+        help="Initial delay in seconds between reconnection attempts (default: 1.0)",
+    )
+    parser.add_argument(
+        "--autossh-reconnect-backoff",
+        dest="reconnect_backoff",
+        type=float,
+        default=2.0,
+        help="Factor by which the reconnect delay grows after each failure (default: 2.0)",
+    )
+    parser.add_argument(
+        "--autossh-reconnect-max-delay",
+        dest="max_reconnect_delay",
+        type=float,
+        default=60.0,
+        help="Maximum delay in seconds between reconnection attempts (default: 60.0)",
+    )
+    parser.add_argument(
+        "--autossh-attempt-reset-seconds",
+        dest="attempt_reset_seconds",
+        type=float,
+        default=60.0,
+        help="Session uptime in seconds after which the failed-attempt counter is reset (default: 60.0)",
+    )
+    parser.add_argument(
+        "--autossh-keepalive-interval",
+        dest="keepalive_interval",
+        type=int,
+        default=15,
+        help="Seconds between SSH server-alive probes (default: 15)",
+    )
+    parser.add_argument(
+        "--autossh-keepalive-count",
+        dest="keepalive_count",
+        type=int,
+        default=3,
+        help="Unanswered server-alive probes before the connection is considered dead (default: 3)",
+    )
+    parser.add_argument(
+        "--autossh-no-keepalive",
+        dest="no_keepalive",
+        action="store_true",
+        help=(
+            "Do not inject ServerAliveInterval/ServerAliveCountMax options; "
+            "defer to the SSH configuration"
+        ),
+    )
+    parser.add_argument(
+        "--autossh-exec-on-success",
+        dest="exec_on_success",
+        action="store_true",
+        help=(
+            "Replace the supervisor with ssh on the last permitted attempt "
+            "(requires --autossh-max-connection-attempts); the final session "
+            "is not supervised or reconnected"
+        ),
     )
     parser.add_argument(
         "--autossh-verbose",
@@ -87,9 +190,16 @@ def create_parser() -> argparse.ArgumentParser:
 
 
 def setup_logging(verbose: bool = False) -> None:
-    """Sets up application-wide logging configuration."""
+    """
+    Sets up application-wide logging configuration.
 
-    level = logging.INFO if not verbose else logging.DEBUG
-    logging.basicConfig(
-        level=level, format="%(asctime)s - %(levelname)s - %(name)s - %(message)s"
-    )
+    Logging is only configured in verbose mode; otherwise the root logger is
+    left untouched and warnings and errors reach stderr through logging's
+    last-resort handler without any handler or formatter being set up.
+    """
+
+    if verbose:
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
+        )
@@ -1,17 +1,45 @@
+import dataclasses
+import functools
 import logging
-import shutil
-import subprocess
+import math
+import os
+import random
+import signal
+import threading
 import time
+import types
 
 from pyautossh.exceptions import SSHClientNotFound, SSHConnectionError
 
 logger = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass(frozen=True)
+class AttemptOutcome:
+    """
+    Outcome of a single SSH connection attempt.
+
+    Attributes
+    ----------
+    success: bool
+        True if the SSH process completed with exit code 0
+    duration_seconds: float
+        How long the SSH process ran
+    """
+
+    success: bool
+    duration_seconds: float
+
+
+@functools.lru_cache(maxsize=1)
 def _find_ssh_executable() -> str:
     """
     Find the SSH executable on the PATH.
 
+    The result is cached so repeated reconnects do not walk the PATH again.
+    Set the PYAUTOSSH_REFRESH_SSH_PATH environment variable to force
+    re-resolution on the next connection.
+
     Returns
     -------
     str
@@ -23,52 +51,143 @@ def _find_ssh_executable() -> str:
         If the SSH executable is not found in the PATH
     """
 
+    # Imported lazily to keep it off the interpreter startup path; the result
+    # is cached so the import happens at most once per process.
+    import shutil
+
     ssh_exec = shutil.which("ssh")
     if ssh_exec:
-        logger.debug(f"ssh executable: {ssh_exec}")
+        logger.debug("ssh executable: %s", ssh_exec)
         return ssh_exec
 
     raise SSHClientNotFound("SSH client executable not found")
 
 
-def _attempt_connection(ssh_exec: str, ssh_args: list[str]) -> bool:
+def _add_keepalive_options(
+    ssh_args: list[str], keepalive_interval: int, keepalive_count: int
+) -> list[str]:
     """
-    Attempt an SSH connection and determine if it completed successfully.
+    Prepend SSH keepalive options to the SSH arguments.
+
+    With default OpenSSH settings a dead peer can leave the TCP session
+    hanging for many minutes before ssh notices; server-alive probes bound
+    the detection time to roughly ``interval * count`` seconds. User-supplied
+    options take precedence: if ``ServerAliveInterval`` already appears in
+    the arguments, they are returned unchanged.
 
     Parameters
     ----------
-    ssh_exec: str
-        Path to the SSH executable
     ssh_args: list[str]
         Arguments forwarded to the SSH command
+    keepalive_interval: int
+        Seconds between server-alive probes
+    keepalive_count: int
+        Number of unanswered probes after which ssh disconnects
 
     Returns
     -------
-    bool
-        True if SSH process completed with exit code 0, False if it is still
-        running or exited with an error.
+    list[str]
+        The SSH arguments with keepalive options prepended
+    """
+
+    if any("ServerAliveInterval" in arg for arg in ssh_args):
+        return ssh_args
+
+    keepalive_options = [
+        "-o",
+        f"ServerAliveInterval={keepalive_interval}",
+        "-o",
+        f"ServerAliveCountMax={keepalive_count}",
+        "-o",
+        "TCPKeepAlive=yes",
+    ]
+    return keepalive_options + ssh_args
+
+
+def _attempt_connection(ssh_command: list[str]) -> AttemptOutcome:
     """
+    Attempt an SSH connection and determine if it completed successfully.
 
-    # Time to wait for SSH process to terminate; if it doesn't, connection is considered active
-    process_timeout_seconds = 30.0
-    with subprocess.Popen([ssh_exec] + ssh_args) as ssh_proc:
+    Parameters
+    ----------
+    ssh_command: list[str]
+        Full SSH command line; the first element is the path to the SSH
+        executable
+
+    Returns
+    -------
+    AttemptOutcome
+        Whether the SSH process completed with exit code 0, and the session
+        duration in seconds.
+
+    Raises
+    ------
+    SSHClientNotFound
+        If the SSH process could not be started at all. Failing to spawn is
+        terminal, unlike a connection that ran and then died, which is
+        reported as an unsuccessful outcome and retried.
+    """
+
+    t_start = time.monotonic()
+    try:
+        pid = os.posix_spawn(ssh_command[0], ssh_command, os.environ)
+    except OSError as exce:
+        raise SSHClientNotFound(f"Failed to start ssh: {exce}") from exce
+
+    forwarded: list[int] = []
+
+    def _forward_signal(signum: int, frame: types.FrameType | None) -> None:
+        forwarded.append(signum)
         try:
-            ssh_proc.wait(timeout=process_timeout_seconds)
-        except subprocess.TimeoutExpired:
-            # Connection is still active. Not a terminal success.
-            return False
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            # The child was already reaped; nothing left to forward to.
+            pass
+
+    # Forward terminal and termination signals to ssh while it runs instead of
+    # relying on process-group inheritance: SIGWINCH keeps remote window sizes
+    # in sync and SIGINT/SIGTERM reach ssh even when only this process is
+    # signalled (e.g. kill by pid). signal.signal is only permitted in the
+    # main thread, so embedders driving connect_ssh from a worker thread (see
+    # cancel_event) run without signal forwarding.
+    if threading.current_thread() is threading.main_thread():
+        previous_handlers = {
+            sig: signal.signal(sig, _forward_signal)
+            for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGWINCH)
+        }
+    else:
+        previous_handlers = {}
+    try:
+        _, wait_status = os.waitpid(pid, 0)
+    finally:
+        for sig, handler in previous_handlers.items():
+            signal.signal(sig, handler)
+    session_duration = time.monotonic() - t_start
 
-    if ssh_proc.returncode == 0:
-        return True
+    returncode = os.waitstatus_to_exitcode(wait_status)
+    if returncode < 0 and -returncode in forwarded:
+        # ssh died from a signal we forwarded; propagate it now that the
+        # original handlers are restored instead of reconnecting.
+        signal.raise_signal(signal.Signals(-returncode))
+    if returncode == 0:
+        return AttemptOutcome(success=True, duration_seconds=session_duration)
 
-    logger.debug(f"ssh exited with code {ssh_proc.returncode}")
-    return False
+    logger.debug("ssh exited with code %d after %.1fs", returncode, session_duration)
+    return AttemptOutcome(success=False, duration_seconds=session_duration)
 
 
 def connect_ssh(
     ssh_args: list[str],
     max_connection_attempts: int | None = None,
     reconnect_delay: float = 1.0,
+    reconnect_backoff: float = 2.0,
+    max_reconnect_delay: float = 60.0,
+    attempt_reset_seconds: float = 60.0,
+    keepalive_interval: int = 15,
+    keepalive_count: int = 3,
+    add_keepalive: bool = True,
+    exec_on_success: bool = False,
+    cancel_event: threading.Event | None = None,
 ) -> None:
     """
     Establish and maintain an SSH connection with automatic reconnection.
@@ -81,7 +200,41 @@ def connect_ssh(
         Maximum number of consecutive failed connection attempts before giving up.
         If None, will try indefinitely. Default is None.
     reconnect_delay: float
-        Time in seconds to wait between reconnection attempts. Default is 1.0.
+        Initial time in seconds to wait between reconnection attempts.
+        Default is 1.0.
+    reconnect_backoff: float
+        Factor by which the reconnect delay grows after each consecutive
+        failure. Default is 2.0.
+    max_reconnect_delay: float
+        Upper bound in seconds for the reconnect delay. Default is 60.0.
+    attempt_reset_seconds: float
+        Sessions that lived at least this long are considered stable; the
+        failed-attempt counter and the reconnect delay are reset afterwards,
+        so a brief outage after hours of uptime does not exhaust the attempt
+        budget. Default is 60.0.
+    keepalive_interval: int
+        Seconds between SSH server-alive probes used to detect dead
+        connections. Default is 15.
+    keepalive_count: int
+        Number of unanswered server-alive probes after which the connection is
+        considered dead. Default is 3.
+    add_keepalive: bool
+        Whether to inject the keepalive options into the ssh command line.
+        Command-line options take precedence over ssh_config, so disable this
+        to honor ServerAliveInterval/ServerAliveCountMax values from the SSH
+        configuration instead. Default is True.
+    exec_on_success: bool
+        If True and max_connection_attempts is set, the last permitted
+        attempt replaces this process with ssh via ``os.execvp`` instead of
+        supervising it, freeing the supervisor's memory for the remainder of
+        the session. The final session is then no longer supervised: it is
+        not reconnected if it drops and does not benefit from the
+        attempt-counter reset. Default is False.
+    cancel_event: threading.Event | None
+        Optional event for embedders running connect_ssh on a worker thread.
+        The reconnect delay is spent waiting on the event instead of in
+        time.sleep, so setting it makes connect_ssh return promptly instead of
+        reconnecting. Default is None.
 
     Raises
     ------
@@ -89,19 +242,62 @@ def connect_ssh(
         If the maximum number of connection attempts is reached
     SSHClientNotFound
         If the SSH executable is not found
+
+    Notes
+    -----
+    With exec_on_success, the last permitted attempt does not return and the
+    exit code is ssh's own.
     """
 
+    if max_connection_attempts is not None and max_connection_attempts <= 0:
+        # An empty attempt budget cannot succeed; fail before resolving the
+        # ssh executable or touching the argument list.
+        raise SSHConnectionError("Exceeded maximum number of connection attempts")
+
+    if os.environ.get("PYAUTOSSH_REFRESH_SSH_PATH"):
+        _find_ssh_executable.cache_clear()
     ssh_exec = _find_ssh_executable()
+    if add_keepalive:
+        ssh_args = _add_keepalive_options(ssh_args, keepalive_interval, keepalive_count)
+    ssh_command = [ssh_exec] + ssh_args
+
+    # Hoist the None check out of the loop: an unlimited attempt budget is
+    # simply an infinite limit.
+    max_attempts: float = (
+        math.inf if max_connection_attempts is None else max_connection_attempts
+    )
 
     num_attempt = 0
-    while max_connection_attempts is None or num_attempt < max_connection_attempts:
+    current_delay = reconnect_delay
+    while num_attempt < max_attempts:
         num_attempt += 1
 
-        if _attempt_connection(ssh_exec, ssh_args):
+        if exec_on_success and num_attempt == max_attempts:
+            # Opted-in final attempt: nothing left to supervise, so hand the
+            # process over to ssh entirely. Does not return.
+            os.execvp(ssh_exec, ssh_command)
+
+        outcome = _attempt_connection(ssh_command)
+        if outcome.success:
             return
 
-        logger.debug(f"Waiting {reconnect_delay}s before reconnecting...")
-        time.sleep(reconnect_delay)
+        if outcome.duration_seconds >= attempt_reset_seconds:
+            # The connection was stable before dropping; start over with a
+            # fresh attempt budget and the base delay instead of backing off.
+            num_attempt = 0
+            current_delay = reconnect_delay
+
+        # Full jitter: draw the whole delay from [0, current_delay] so
+        # simultaneously disconnected clients decorrelate as much as possible.
+        delay = random.uniform(0.0, current_delay)
+        logger.debug("Waiting %.1fs before reconnecting...", delay)
+        if cancel_event is None:
+            time.sleep(delay)
+        elif cancel_event.wait(delay):
+            logger.debug("Reconnection cancelled")
+            return
         logger.debug("Reconnecting...")
 
+        current_delay = min(current_delay * reconnect_backoff, max_reconnect_delay)
+
     raise SSHConnectionError("Exceeded maximum number of connection attempts")
@@ -1,2 +1,164 @@
-def test_pyautossh():
-    assert True
+import os
+import sys
+import threading
+import time
+from typing import NamedTuple
+
+import pytest
+
+import pyautossh.pyautossh
+from pyautossh.cli import create_parser
+from pyautossh.exceptions import SSHConnectionError
+from pyautossh.pyautossh import AttemptOutcome, _add_keepalive_options, connect_ssh
+
+SSH_ARGS_TEST = ("user@host",)
+MAX_ATTEMPTS = 3
+ALL_FAILED_OUTCOMES = [False] * MAX_ATTEMPTS
+
+
+class AttemptConnectionLog(NamedTuple):
+    """Columnar record of mocked connection attempts (one list per field)."""
+
+    ssh_commands: list
+    successes: list
+
+    @property
+    def num_attempts(self):
+        return len(self.ssh_commands)
+
+
+def make_mock_attempt_connection(attempt_outcomes, attempt_connection_log):
+    """
+    Create a stand-in for _attempt_connection.
+
+    Consumes the given success flags one per call via an iterator (no copy of
+    the outcome list, no O(n) pop(0)) and records each attempt column-wise in
+    attempt_connection_log.
+    """
+
+    outcome_iter = iter(attempt_outcomes)
+
+    def mock_attempt_connection(ssh_command):
+        success = next(outcome_iter)
+        attempt_connection_log.ssh_commands.append(ssh_command)
+        attempt_connection_log.successes.append(success)
+        return AttemptOutcome(success=success, duration_seconds=0.0)
+
+    return mock_attempt_connection
+
+
+def fail_execvp(file, args):
+    raise AssertionError("ssh should be supervised, not exec'd")
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+
+
+@pytest.fixture(autouse=True)
+def mock_ssh_executable(monkeypatch):
+    monkeypatch.setattr(
+        pyautossh.pyautossh, "_find_ssh_executable", lambda: "/usr/bin/ssh"
+    )
+
+
+@pytest.mark.parametrize(
+    "attempt_outcomes, max_connection_attempts, succeeds",
+    [
+        pytest.param([True], None, True, id="first-attempt-succeeds"),
+        pytest.param([False, False, True], None, True, id="succeeds-after-retries"),
+        pytest.param(
+            ALL_FAILED_OUTCOMES, MAX_ATTEMPTS, False, id="attempt-limit-reached"
+        ),
+    ],
+)
+def test_connect(monkeypatch, attempt_outcomes, max_connection_attempts, succeeds):
+    ssh_args_test = list(SSH_ARGS_TEST)
+    attempt_connection_log = AttemptConnectionLog([], [])
+    monkeypatch.setattr(os, "execvp", fail_execvp)
+    monkeypatch.setattr(
+        pyautossh.pyautossh,
+        "_attempt_connection",
+        make_mock_attempt_connection(attempt_outcomes, attempt_connection_log),
+    )
+
+    if succeeds:
+        connect_ssh(ssh_args_test, max_connection_attempts=max_connection_attempts)
+    else:
+        with pytest.raises(SSHConnectionError):
+            connect_ssh(ssh_args_test, max_connection_attempts=max_connection_attempts)
+
+    expected_command = ["/usr/bin/ssh"] + _add_keepalive_options(ssh_args_test, 15, 3)
+    expected_commands = [expected_command] * len(attempt_outcomes)
+    assert attempt_connection_log.ssh_commands == expected_commands
+    assert attempt_connection_log.successes == attempt_outcomes
+
+
+def test_connect_execs_ssh_on_final_attempt_when_opted_in(monkeypatch):
+    ssh_args_test = list(SSH_ARGS_TEST)
+    exec_log = []
+    attempt_connection_log = AttemptConnectionLog([], [])
+    # The stubbed execvp returns instead of replacing the process, so the
+    # final attempt still runs and the loop falls through to the raise.
+    monkeypatch.setattr(os, "execvp", lambda file, args: exec_log.append(args))
+    monkeypatch.setattr(
+        pyautossh.pyautossh,
+        "_attempt_connection",
+        make_mock_attempt_connection(ALL_FAILED_OUTCOMES, attempt_connection_log),
+    )
+
+    with pytest.raises(SSHConnectionError):
+        connect_ssh(
+            ssh_args_test,
+            max_connection_attempts=MAX_ATTEMPTS,
+            exec_on_success=True,
+        )
+
+    expected_command = ["/usr/bin/ssh"] + _add_keepalive_options(ssh_args_test, 15, 3)
+    assert exec_log == [expected_command]
+
+
+def test_connect_stops_when_cancel_event_is_set(monkeypatch):
+    cancel_event = threading.Event()
+    cancel_event.set()
+    attempt_connection_log = AttemptConnectionLog([], [])
+    monkeypatch.setattr(
+        pyautossh.pyautossh,
+        "_attempt_connection",
+        make_mock_attempt_connection([False], attempt_connection_log),
+    )
+
+    connect_ssh(list(SSH_ARGS_TEST), cancel_event=cancel_event)
+
+    assert attempt_connection_log.successes == [False]
+
+
+def test_attempt_connection_runs_on_worker_thread():
+    # Signal handlers can only be installed in the main thread; the real
+    # _attempt_connection must still work when driven from a worker thread.
+    outcomes = []
+    thread = threading.Thread(
+        target=lambda: outcomes.append(
+            pyautossh.pyautossh._attempt_connection([sys.executable, "-c", ""])
+        )
+    )
+    thread.start()
+    thread.join()
+
+    assert len(outcomes) == 1
+    assert outcomes[0].success
+
+
+def test_connect_with_zero_attempts_fails_without_ssh_lookup(monkeypatch):
+    def fail_lookup():
+        raise AssertionError("ssh executable should not be resolved")
+
+    monkeypatch.setattr(pyautossh.pyautossh, "_find_ssh_executable", fail_lookup)
+
+    with pytest.raises(SSHConnectionError):
+        connect_ssh(list(SSH_ARGS_TEST), max_connection_attempts=0)
+
+
+def test_create_parser_is_cached():
+    assert create_parser() is create_parser()